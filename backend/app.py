@@ -1,17 +1,29 @@
-from flask import Flask, jsonify
+from flask import Flask, Response, request
 from flask_cors import CORS
 import psutil
 import platform
 import logging
+import os
+import json
+import gzip
+import hashlib
+import ipaddress
 import re
+import socket
 import pythoncom
 import requests
+from requests.adapters import HTTPAdapter
 import time
-from typing import Dict, List, Optional, Any, Tuple
+import threading
+import atexit
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from functools import lru_cache
-import subprocess
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import glob
+import ctypes
+import ctypes.util
 
 try:
     import pynvml
@@ -19,18 +31,41 @@ try:
 except ImportError:
     NVML_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configuration constants
 class Config:
     CACHE_DURATION = 300  # seconds
+    IP_FAILURE_CACHE_DURATION = 60  # seconds
     MAX_TEMP_CELSIUS = 150
     MIN_TEMP_CELSIUS = 0
-    MOCK_TEMP_BASE = 35
-    MOCK_TEMP_RANGE = 30
-    REQUEST_TIMEOUT = 5
+    REQUEST_CONNECT_TIMEOUT = 1  # seconds
+    REQUEST_TIMEOUT = 3  # seconds, read timeout
     MAX_RETRIES = 2
+    IP_REFRESH_INTERVAL = 60  # seconds
     WMI_TEMP_KELVIN_MIN = 273
     WMI_TEMP_KELVIN_MAX = 423
     WIFI_SPEED_MAX = 10000000
+    HARDWARE_CACHE_DURATION = 3600  # seconds
+    GPU_REFRESH_INTERVAL = 300  # seconds
+    CPU_SAMPLE_INTERVAL = 1.0  # seconds
+    TEMP_CACHE_TTL = 5  # seconds
+    TEMP_REPROBE_INTERVAL = 300  # seconds between probes while no sensor source has been found
+    PARTITION_CACHE_TTL = 30  # seconds
+    INTERFACE_CACHE_TTL = 30  # seconds
+    DISK_USAGE_TIMEOUT = 0.5  # seconds
+    COLLECTOR_TIMEOUT = 5  # seconds
+    COMPRESS_MIN_SIZE = 512  # bytes
+    COMPRESS_LEVEL = 6
+    SYSTEM_INFO_CACHE_TTL = max(0.1, float(os.environ.get('SYSTEM_INFO_CACHE_TTL', '1.0')))  # seconds
+    SNAPSHOT_IDLE_TIMEOUT = 30  # seconds without a request before the snapshot refresher stops
+    STREAM_INTERVAL = 1.0  # seconds
+    STREAM_HEARTBEAT_INTERVAL = 15  # seconds
+    MAX_STREAMS = 4  # each open stream holds a server thread; waitress runs 8
 
 # Set up logging
 logging.basicConfig(level=logging.ERROR)
@@ -51,8 +86,75 @@ io_offsets = {
 
 ip_cache = {
     'data': None,
-    'timestamp': 0
+    'timestamp': 0,
+    'expires': 0
+}
+ip_cache_lock = threading.Lock()
+
+def _get_windows_version() -> str:
+    """Derive the Windows marketing version from the build number"""
+    try:
+        build = int(platform.version().split('.')[-1])
+    except ValueError:
+        return 'Unknown'
+    return 'Windows 11' if build >= 22000 else 'Windows 10'
+
+# Platform details never change during the process lifetime
+PLATFORM_INFO = {
+    'system': platform.system(),
+    'release': platform.release(),
+    'version': platform.version(),
+    'windows_version': _get_windows_version(),
+    'architecture': platform.machine(),
+    'processor': platform.processor()
+}
+
+hardware_cache = {
+    'data': None,
+    'timestamp': 0,
+    'gpu_timestamp': 0
+}
+hardware_cache_lock = threading.Lock()
+
+# Pre-serialized /api/system-info snapshot shared by concurrent pollers and streams.
+# The snapshot dict (body, gzip_body, etag) is replaced as a whole, never mutated.
+system_info_cache = {
+    'snapshot': None,
+    'timestamp': 0,
+    'last_request': 0
 }
+system_info_cache_lock = threading.Lock()
+snapshot_refresher_lock = threading.Lock()
+snapshot_refresher_thread: Optional[threading.Thread] = None
+
+# Open /api/system-info/stream connections, capped so streams can't take every server thread
+active_streams = {'count': 0}
+active_streams_lock = threading.Lock()
+
+# Worker pool for running independent collectors concurrently
+collector_pool = ThreadPoolExecutor(max_workers=6, thread_name_prefix='collector')
+
+# Separate pool for per-partition disk_usage calls, which run from inside a collector
+disk_usage_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='disk-usage')
+
+# One worker per external IP service so lookups race instead of running back to back
+ip_lookup_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='ip-lookup')
+
+# COM apartments are per-thread, so each thread keeps its own WMI connection
+wmi_local = threading.local()
+
+def get_wmi_instance(namespace: str = 'root\\cimv2'):
+    """Get the WMI connection to a namespace for the current thread, initializing COM on first use"""
+    instances = getattr(wmi_local, 'instances', None)
+    if instances is None:
+        pythoncom.CoInitialize()
+        instances = wmi_local.instances = {}
+
+    instance = instances.get(namespace)
+    if instance is None:
+        import wmi
+        instance = instances[namespace] = wmi.WMI(namespace=namespace)
+    return instance
 
 # CPU Architecture Detection
 class CPUArchitectureDetector:
@@ -78,9 +180,21 @@ class CPUArchitectureDetector:
         }
     }
 
+    # Lower-case name tokens used to recognize each CPU family
+    INTEL_TOKENS = ('intel', 'core i')
+    AMD_SERIES_TOKENS = ('ryzen 7', 'ryzen 8', 'ryzen 9')
+    APPLE_TOKENS = ('apple m', 'apple silicon', 'm1', 'm2', 'm3', 'm4')
+
     @classmethod
     def detect_core_types(cls, physical_cores: int, logical_processors: int, hardware_info: Optional[Dict] = None) -> Dict[str, int]:
         """Detect P-cores vs E-cores using physical vs logical processor counts"""
+        # The counts fully determine the result, so memoize on them (hardware_info is unhashable)
+        return dict(cls._detect_core_types_cached(physical_cores, logical_processors))
+
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _detect_core_types_cached(cls, physical_cores: int, logical_processors: int) -> Dict[str, int]:
+        """Memoized core type detection keyed on the processor counts"""
         try:
             if physical_cores == logical_processors:
                 return cls._create_core_result(physical_cores, 0, physical_cores)
@@ -128,15 +242,15 @@ class CPUArchitectureDetector:
 
     @classmethod
     def _is_intel_cpu(cls, processor_name: str, manufacturer: str) -> bool:
-        return any(arch in processor_name for arch in ['intel', 'core i']) or 'intel' in manufacturer
+        return any(arch in processor_name for arch in cls.INTEL_TOKENS) or 'intel' in manufacturer
 
     @classmethod
     def _is_amd_cpu(cls, manufacturer: str, processor_name: str) -> bool:
-        return 'amd' in manufacturer and any(arch in processor_name for arch in ['ryzen 7', 'ryzen 8', 'ryzen 9'])
+        return 'amd' in manufacturer and any(arch in processor_name for arch in cls.AMD_SERIES_TOKENS)
 
     @classmethod
     def _is_apple_silicon(cls, processor_name: str) -> bool:
-        return any(arch in processor_name for arch in ['apple m', 'apple silicon', 'm1', 'm2', 'm3', 'm4'])
+        return any(arch in processor_name for arch in cls.APPLE_TOKENS)
 
     @classmethod
     def _is_qualcomm_cpu(cls, manufacturer: str, processor_name: str) -> bool:
@@ -222,12 +336,13 @@ class TemperatureDetector:
     SENSOR_CONFIGS = {
         'Linux': {
             'psutil_sensors': ['coretemp', 'cpu_thermal', 'k10temp', 'acpi_thermal', 'thermal_zone0'],
-            'thermal_zones_path': '/sys/class/thermal/thermal_zone*/temp',
-            'lm_sensors_cmd': ['sensors'],
+            'thermal_class_path': '/sys/class/thermal',
+            'hwmon_path': '/sys/class/hwmon/hwmon*/temp*_input',
             'temp_conversion_factor': 1000.0  # Convert from millicelsius
         },
         'Windows': {
-            'wmi_class': 'Win32_TemperatureProbe',
+            'probe_query': 'SELECT CurrentReading, Name FROM Win32_TemperatureProbe',
+            'thermal_zone_query': 'SELECT CurrentTemperature, InstanceName FROM MSAcpi_ThermalZoneTemperature',
             'temp_range_kelvin': (273, 423),
             'conversion_factor': 273.15  # Convert from Kelvin to Celsius
         },
@@ -236,38 +351,105 @@ class TemperatureDetector:
         }
     }
 
+    # psutil sensor names to check, in priority order
+    PSUTIL_SENSOR_NAMES = (
+        'coretemp', 'cpu_thermal', 'k10temp', 'acpi_thermal', 'thermal_zone0',
+        'cpu_0', 'cpu_1', 'cpu_2', 'cpu_3', 'cpu_4', 'cpu_5', 'cpu_6', 'cpu_7',
+        'cpu', 'thermal', 'hwmon', 'sensors', 'temperatures'
+    )
+
+    # psutil only reports temperatures on these platforms
+    PSUTIL_SENSOR_PLATFORMS = ('Linux', 'FreeBSD')
+
+    # (timestamp, temperatures) swapped as a whole by the refresher so reads need no lock
+    _snapshot: Tuple[float, Optional[List[Dict[str, Any]]]] = (0.0, None)
+    _lock = threading.Lock()
+    _thread: Optional[threading.Thread] = None
+    # Sensor source chosen by the last probe; 'none' when the machine exposed no sensors
+    _source: Optional[str] = None
+    _probed_at = 0.0
+
+    @classmethod
+    def start(cls) -> None:
+        """Start the background temperature refresher if it is not already running"""
+        with cls._lock:
+            if cls._thread is not None and cls._thread.is_alive():
+                return
+            cls._thread = threading.Thread(target=cls._refresh_loop, name='temperature-refresher', daemon=True)
+            cls._thread.start()
+
+    @classmethod
+    def _refresh_loop(cls) -> None:
+        """Refresh the temperature snapshot every Config.TEMP_CACHE_TTL seconds"""
+        while True:
+            try:
+                cls._snapshot = (time.monotonic(), cls._detect_cpu_temperatures())
+            except Exception as e:
+                logger.warning(f"Temperature refresher failed: {e}")
+            time.sleep(Config.TEMP_CACHE_TTL)
+
     @classmethod
     def get_cpu_temperatures(cls) -> List[Dict[str, Any]]:
-        """Get CPU temperatures using platform-specific methods"""
-        current_platform = platform.system()
-        logger.info(f"Detecting CPU temperatures on platform: {current_platform}")
+        """Get the latest CPU temperatures collected by the background refresher"""
+        cls.start()
+        timestamp, temperatures = cls._snapshot
+        # Allow one missed refresh before treating the snapshot as stale
+        if temperatures is not None and time.monotonic() - timestamp < 2 * Config.TEMP_CACHE_TTL:
+            return temperatures
 
-        # Try psutil first (cross-platform)
-        temperatures = cls._try_psutil_sensors()
-        if temperatures:
-            logger.info(f"Found {len(temperatures)} temperature sensors via psutil")
+        # No usable snapshot yet, read directly
+        with cls._lock:
+            temperatures = cls._detect_cpu_temperatures()
+            cls._snapshot = (time.monotonic(), temperatures)
             return temperatures
 
-        # Platform-specific methods
+    @classmethod
+    def _detect_cpu_temperatures(cls) -> List[Dict[str, Any]]:
+        """Get CPU temperatures from the sensor source found by the probe"""
+        # Sensor drivers or WMI can come up after we do, so retry a probe that found nothing
+        if cls._source is None or (cls._source == 'none' and
+                                   time.monotonic() - cls._probed_at >= Config.TEMP_REPROBE_INTERVAL):
+            cls._source = cls._probe_temperature_source()
+            cls._probed_at = time.monotonic()
+            logger.info("Using temperature source: %s", cls._source)
+
+        reader = cls._get_temperature_readers().get(cls._source)
+        return cls._read_temperatures(cls._source, reader) if reader is not None else []
+
+    @classmethod
+    def _read_temperatures(cls, source: str, reader: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Run a temperature reader, treating an unexpected error as no readings"""
+        try:
+            return reader()
+        except Exception as e:
+            # Readers handle their expected sensor errors; a bad sensor must not take down the CPU info
+            logger.warning("Unexpected error reading temperatures via %s: %s", source, e)
+            return []
+
+    @classmethod
+    def _get_temperature_readers(cls) -> Dict[str, Callable[[], List[Dict[str, Any]]]]:
+        """Map each temperature source available on this platform to its reader, in priority order"""
+        readers = {'psutil': cls._try_psutil_sensors}
+        current_platform = platform.system()
         if current_platform == "Linux":
-            temperatures = cls._get_linux_temperatures()
-            if temperatures:
-                logger.info(f"Found {len(temperatures)} temperature sensors via Linux methods")
-                return temperatures
+            readers['linux_sysfs'] = cls._get_linux_temperatures
         elif current_platform == "Windows":
-            temperatures = cls._get_windows_temperatures()
-            if temperatures:
-                logger.info(f"Found {len(temperatures)} temperature sensors via Windows WMI")
-                return temperatures
+            readers['wmi'] = cls._get_windows_temperatures
         elif current_platform == "Darwin":
-            temperatures = cls._get_macos_temperatures()
+            readers['sysctl'] = cls._get_macos_temperatures
+        return readers
+
+    @classmethod
+    def _probe_temperature_source(cls) -> str:
+        """Find the first temperature source that yields readings, or 'none'"""
+        for source, reader in cls._get_temperature_readers().items():
+            temperatures = cls._read_temperatures(source, reader)
             if temperatures:
-                logger.info(f"Found {len(temperatures)} temperature sensors via macOS")
-                return temperatures
+                logger.info("Found %s temperature sensors via %s", len(temperatures), source)
+                return source
 
-        # Fallback to mock data - always provide something
-        logger.info("No real temperature sensors found, using mock data")
-        return cls._get_mock_temperatures()
+        logger.info("No real temperature sensors found")
+        return 'none'
 
     @classmethod
     def _try_psutil_sensors(cls) -> List[Dict[str, Any]]:
@@ -277,42 +459,38 @@ class TemperatureDetector:
                 logger.warning("psutil.sensors_temperatures not available")
                 return []
 
+            if platform.system() not in cls.PSUTIL_SENSOR_PLATFORMS:
+                # Always empty here, skip the call entirely
+                return []
+
             temps = psutil.sensors_temperatures()  # type: ignore
             if not temps:
                 logger.warning("No temperature sensors found by psutil")
                 return []
 
-            # Expanded list of sensor names to check
-            sensor_names = [
-                'coretemp', 'cpu_thermal', 'k10temp', 'acpi_thermal', 'thermal_zone0',
-                'cpu_0', 'cpu_1', 'cpu_2', 'cpu_3', 'cpu_4', 'cpu_5', 'cpu_6', 'cpu_7',
-                'cpu', 'thermal', 'hwmon', 'sensors', 'temperatures'
-            ]
-
             temperatures = []
 
-            # Check all available sensor types
-            for sensor_name in sensor_names:
-                if sensor_name in temps:
-                    logger.info(f"Found temperature sensor: {sensor_name}")
-                    for temp_sensor in temps[sensor_name]:
-                        if hasattr(temp_sensor, 'current'):
-                            temp_value = temp_sensor.current
-                            # Less strict temperature validation
-                            if temp_value > -50 and temp_value < 200:  # Reasonable CPU temp range
-                                temperatures.append({
-                                    'label': getattr(temp_sensor, 'label', f'{sensor_name}_sensor'),
-                                    'current': temp_value
-                                })
+            # Check available sensor types in priority order, only visiting those psutil reported
+            for sensor_name in (name for name in cls.PSUTIL_SENSOR_NAMES if name in temps):
+                logger.info("Found temperature sensor: %s", sensor_name)
+                for temp_sensor in temps[sensor_name]:
+                    if hasattr(temp_sensor, 'current'):
+                        temp_value = temp_sensor.current
+                        # Less strict temperature validation
+                        if temp_value > -50 and temp_value < 200:  # Reasonable CPU temp range
+                            temperatures.append({
+                                'label': getattr(temp_sensor, 'label', f'{sensor_name}_sensor'),
+                                'current': temp_value
+                            })
 
             if temperatures:
-                logger.info(f"Successfully retrieved {len(temperatures)} temperature readings")
+                logger.info("Successfully retrieved %s temperature readings", len(temperatures))
                 return temperatures
             else:
                 logger.warning("No valid temperature readings found in sensors")
 
-        except Exception as e:
-            logger.warning(f"Failed to get psutil temperatures: {e}")
+        except (AttributeError, OSError) as e:
+            logger.warning("Failed to get psutil temperatures: %s", e)
 
         return []
 
@@ -322,133 +500,169 @@ class TemperatureDetector:
         temperatures = []
 
         # Try thermal zones
-        try:
-            thermal_zones = glob.glob(cls.SENSOR_CONFIGS['Linux']['thermal_zones_path'])
-            for zone_file in thermal_zones:
-                try:
-                    with open(zone_file, 'r') as f:
-                        temp_millicelsius = int(f.read().strip())
-                        temp_celsius = temp_millicelsius / cls.SENSOR_CONFIGS['Linux']['temp_conversion_factor']
-
-                        if cls._is_valid_temperature(temp_celsius):
-                            temperatures.append({
-                                'label': f'Zone {zone_file.split("/")[-2]}',
-                                'current': temp_celsius
-                            })
-                except (OSError, ValueError):
-                    continue
-        except Exception as e:
-            logger.warning(f"Failed to get Linux thermal zone temperatures: {e}")
+        linux_config = cls.SENSOR_CONFIGS['Linux']
+        for label, temp_file in cls._get_thermal_zone_files():
+            try:
+                temp_millicelsius = cls._read_sysfs_int(temp_file)
+            except (OSError, ValueError):
+                continue
+
+            temp_celsius = temp_millicelsius / linux_config['temp_conversion_factor']
+            if cls._is_valid_temperature(temp_celsius):
+                temperatures.append({
+                    'label': label,
+                    'current': temp_celsius
+                })
 
-        # Try lm-sensors
+        # Try hwmon sensors (the same data lm-sensors reports)
         if not temperatures:
-            temperatures.extend(cls._get_linux_lm_sensors())
+            temperatures.extend(cls._get_linux_hwmon_temperatures())
 
         return temperatures
 
     @classmethod
-    def _get_linux_lm_sensors(cls) -> List[Dict[str, Any]]:
-        """Get temperatures using lm-sensors on Linux"""
+    def _get_linux_hwmon_temperatures(cls) -> List[Dict[str, Any]]:
+        """Get temperatures by reading hwmon sysfs entries directly on Linux"""
         temperatures = []
-        try:
-            result = subprocess.run(
-                cls.SENSOR_CONFIGS['Linux']['lm_sensors_cmd'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if '°C' in line and ('temp' in line.lower() or 'core' in line.lower()):
-                        temp_value = cls._parse_lm_sensor_line(line)
-                        if temp_value and cls._is_valid_temperature(temp_value):
-                            temperatures.append({
-                                'label': line.split(':')[0].strip(),
-                                'current': temp_value
-                            })
-        except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+        linux_config = cls.SENSOR_CONFIGS['Linux']
+
+        for label, input_file in cls._get_hwmon_input_files():
+            try:
+                temp_celsius = cls._read_sysfs_int(input_file) / linux_config['temp_conversion_factor']
+            except (OSError, ValueError):
+                continue
+
+            if cls._is_valid_temperature(temp_celsius):
+                temperatures.append({
+                    'label': label,
+                    'current': temp_celsius
+                })
 
         return temperatures
 
+    @classmethod
+    def _get_thermal_zone_files(cls) -> Tuple[Tuple[str, str], ...]:
+        """List (label, temp file) for each thermal zone, rescanning until some are found"""
+        files = cls._scan_thermal_zone_files()
+        if not files:
+            # Don't keep a failed or empty scan; the zones may not be registered yet
+            cls._scan_thermal_zone_files.cache_clear()
+        return files
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _scan_thermal_zone_files(cls) -> Tuple[Tuple[str, str], ...]:
+        """Scan the thermal zones; they are fixed once the kernel has booted"""
+        try:
+            with os.scandir(cls.SENSOR_CONFIGS['Linux']['thermal_class_path']) as entries:
+                return tuple(sorted((f'Zone {entry.name}', os.path.join(entry.path, 'temp'))
+                                    for entry in entries if entry.name.startswith('thermal_zone')))
+        except OSError as e:
+            logger.warning("Failed to list Linux thermal zones: %s", e)
+            return ()
+
+    @classmethod
+    def _get_hwmon_input_files(cls) -> Tuple[Tuple[str, str], ...]:
+        """List (label, input file) for each hwmon temperature sensor, rescanning until some are found"""
+        files = cls._scan_hwmon_input_files()
+        if not files:
+            # hwmon drivers can load after startup, so don't keep an empty scan
+            cls._scan_hwmon_input_files.cache_clear()
+        return files
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _scan_hwmon_input_files(cls) -> Tuple[Tuple[str, str], ...]:
+        """Scan the hwmon temperature inputs, resolving labels once"""
+        return tuple((cls._read_hwmon_label(input_file), input_file)
+                     for input_file in sorted(glob.glob(cls.SENSOR_CONFIGS['Linux']['hwmon_path'])))
+
+    @classmethod
+    def _read_sysfs_int(cls, path: str) -> int:
+        """Read a small integer sysfs attribute with a single unbuffered read"""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            return int(os.read(fd, 32))
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def _read_hwmon_label(cls, input_file: str) -> str:
+        """Read the label paired with a hwmon tempN_input file"""
+        sensor_path = input_file[:-len('_input')]
+        try:
+            with open(sensor_path + '_label', 'r') as f:
+                return f.read().strip()
+        except OSError:
+            # Unlabelled sensor, fall back to e.g. "hwmon2 temp1"
+            return f"{os.path.basename(os.path.dirname(sensor_path))} {os.path.basename(sensor_path)}"
+
     @classmethod
     def _get_windows_temperatures(cls) -> List[Dict[str, Any]]:
         """Get temperatures on Windows systems using WMI"""
         temperatures = []
         try:
-            pythoncom.CoInitialize()
             import wmi
-            
-            # First, try the existing method
+        except ImportError:
+            logger.warning("WMI module not found, skipping Windows temperatures")
+            return temperatures
+
+        # Errors raised by COM/WMI itself; anything else is caught by _read_temperatures
+        wmi_errors = (wmi.x_wmi, pythoncom.com_error, AttributeError)
+
+        # First, try the existing method
+        try:
+            wmi_instance = get_wmi_instance()
+            wmi_cpu = wmi_instance.query(cls.SENSOR_CONFIGS['Windows']['probe_query'])
+            for probe in wmi_cpu:
+                if hasattr(probe, 'CurrentReading'):
+                    temp_kelvin = probe.CurrentReading
+                    if temp_kelvin and cls._is_valid_kelvin_temperature(temp_kelvin):
+                        temp_celsius = temp_kelvin - cls.SENSOR_CONFIGS['Windows']['conversion_factor']
+                        temperatures.append({
+                            'label': getattr(probe, 'Name', 'CPU Temperature'),
+                            'current': temp_celsius
+                        })
+        except wmi_errors as e:
+            logger.warning("Failed to get Windows temperatures with Win32_TemperatureProbe: %s", e)
+
+        # If the first method fails or returns no data, try the thermal zone method
+        if not temperatures:
             try:
-                wmi_instance = wmi.WMI()
-                wmi_cpu = wmi_instance.Win32_TemperatureProbe()
-                for probe in wmi_cpu:
-                    if hasattr(probe, 'CurrentReading'):
-                        temp_kelvin = probe.CurrentReading
-                        if temp_kelvin and cls._is_valid_kelvin_temperature(temp_kelvin):
-                            temp_celsius = temp_kelvin - cls.SENSOR_CONFIGS['Windows']['conversion_factor']
+                wmi_instance_thermal = get_wmi_instance('root\\wmi')
+                temp_probes = wmi_instance_thermal.query(cls.SENSOR_CONFIGS['Windows']['thermal_zone_query'])
+                for i, probe in enumerate(temp_probes):
+                    if hasattr(probe, 'CurrentTemperature'):
+                        temp_deci_kelvin = probe.CurrentTemperature
+                        temp_celsius = (temp_deci_kelvin / 10.0) - 273.15
+                        if cls._is_valid_temperature(temp_celsius):
                             temperatures.append({
-                                'label': getattr(probe, 'Name', 'CPU Temperature'),
+                                'label': getattr(probe, 'InstanceName', f'Thermal Zone {i}').replace('_TZ', ' TZ'),
                                 'current': temp_celsius
                             })
-            except Exception as e:
-                logger.warning(f"Failed to get Windows temperatures with Win32_TemperatureProbe: {e}")
-
-            # If the first method fails or returns no data, try the thermal zone method
-            if not temperatures:
-                try:
-                    wmi_instance_thermal = wmi.WMI(namespace="root\\wmi")
-                    temp_probes = wmi_instance_thermal.MSAcpi_ThermalZoneTemperature()
-                    for i, probe in enumerate(temp_probes):
-                        if hasattr(probe, 'CurrentTemperature'):
-                            temp_deci_kelvin = probe.CurrentTemperature
-                            temp_celsius = (temp_deci_kelvin / 10.0) - 273.15
-                            if cls._is_valid_temperature(temp_celsius):
-                                temperatures.append({
-                                    'label': getattr(probe, 'InstanceName', f'Thermal Zone {i}').replace('_TZ', ' TZ'),
-                                    'current': temp_celsius
-                                })
-                except Exception as e:
-                    logger.warning(f"Failed to get Windows temperatures with MSAcpi_ThermalZoneTemperature: {e}")
-
-        except Exception as e:
-            logger.warning(f"Failed to get Windows temperatures: {e}")
+            except wmi_errors as e:
+                logger.warning("Failed to get Windows temperatures with MSAcpi_ThermalZoneTemperature: %s", e)
 
         return temperatures
 
     @classmethod
     def _get_macos_temperatures(cls) -> List[Dict[str, Any]]:
-        """Get temperatures on macOS systems"""
+        """Get temperatures on macOS systems via sysctlbyname"""
         temperatures = []
         try:
-            result = subprocess.run(['sysctl', '-a'], capture_output=True, text=True)
-
-            for line in result.stdout.split('\n'):
-                if any(pattern in line for pattern in cls.SENSOR_CONFIGS['Darwin']['sysctl_patterns']):
-                    temp_value = cls._parse_sysctl_line(line)
-                    if temp_value and cls._is_valid_temperature(temp_value):
-                        temperatures.append({
-                            'label': 'CPU Temperature',
-                            'current': temp_value
-                        })
+            libc = ctypes.CDLL(ctypes.util.find_library('c'))
+            for name in cls.SENSOR_CONFIGS['Darwin']['sysctl_patterns']:
+                temp_value = cls._read_sysctl_value(libc, name)
+                if temp_value and cls._is_valid_temperature(temp_value):
+                    temperatures.append({
+                        'label': 'CPU Temperature',
+                        'current': temp_value
+                    })
         except Exception as e:
-            logger.warning(f"Failed to get macOS temperatures: {e}")
+            logger.warning("Failed to get macOS temperatures: %s", e)
 
         return temperatures
 
-    @classmethod
-    def _get_mock_temperatures(cls) -> List[Dict[str, Any]]:
-        """Generate mock temperature data when no sensors are available"""
-        import random
-        mock_temp = Config.MOCK_TEMP_BASE + random.uniform(0, Config.MOCK_TEMP_RANGE)
-        logger.info(f"Using mock temperature data (no real sensors detected): {mock_temp}°C")
-        return [{
-            'label': 'CPU Core (Mock)',
-            'current': mock_temp
-        }]
-
     @classmethod
     def _is_valid_temperature(cls, temp: float) -> bool:
         """Check if temperature is in valid range"""
@@ -461,45 +675,128 @@ class TemperatureDetector:
                 cls.SENSOR_CONFIGS['Windows']['temp_range_kelvin'][1])
 
     @classmethod
-    def _parse_lm_sensor_line(cls, line: str) -> Optional[float]:
-        """Parse temperature from lm-sensors output line"""
+    def _read_sysctl_value(cls, libc, name: str) -> Optional[float]:
+        """Read a numeric sysctl value by name without spawning the sysctl tool"""
+        buffer = ctypes.create_string_buffer(64)
+        size = ctypes.c_size_t(ctypes.sizeof(buffer))
+        if libc.sysctlbyname(name.encode('ascii'), buffer, ctypes.byref(size), None, ctypes.c_size_t(0)) != 0:
+            return None
+
+        if size.value == ctypes.sizeof(ctypes.c_double):
+            return ctypes.c_double.from_buffer(buffer).value
+        if size.value == ctypes.sizeof(ctypes.c_int):
+            return float(ctypes.c_int.from_buffer(buffer).value)
         try:
-            parts = line.split(':')
-            if len(parts) >= 2:
-                temp_part = parts[1].strip()
-                if '+' in temp_part:
-                    temp_str = temp_part.split('+')[-1].strip()
-                    return float(temp_str.replace('°C', '').strip())
-        except (ValueError, IndexError):
-            pass
-        return None
+            return float(buffer.value.decode('ascii').strip())
+        except (UnicodeDecodeError, ValueError):
+            return None
+
+# Cached psutil enumerations
+# Partitions and interface addresses change on the order of minutes, so they are
+# memoized per TTL period instead of being re-enumerated on every request
+# One entry per all_partitions value, so a diagnostic ?all=1 request doesn't evict the regular one
+@lru_cache(maxsize=2)
+def _disk_partitions_for_period(period: int, all_partitions: bool) -> list:
+    return psutil.disk_partitions(all=all_partitions)
+
+@lru_cache(maxsize=1)
+def _net_if_addrs_for_period(period: int) -> Dict[str, list]:
+    return psutil.net_if_addrs()
+
+def get_disk_partitions(all_partitions: bool = True) -> list:
+    """Get disk partitions, re-enumerated at most once per Config.PARTITION_CACHE_TTL"""
+    return _disk_partitions_for_period(int(time.monotonic() // Config.PARTITION_CACHE_TTL), all_partitions)
+
+def get_net_if_addrs() -> Dict[str, list]:
+    """Get interface addresses, re-enumerated at most once per Config.INTERFACE_CACHE_TTL"""
+    return _net_if_addrs_for_period(int(time.monotonic() // Config.INTERFACE_CACHE_TTL))
+
+@lru_cache(maxsize=1)
+def get_cpu_counts() -> Tuple[Optional[int], Optional[int]]:
+    """Get (physical, logical) CPU counts, which are fixed for the life of the process"""
+    return psutil.cpu_count(logical=False), psutil.cpu_count(logical=True)
+
+# CPU Usage Sampler
+class CPUSampler:
+    """Samples CPU usage in a background thread so requests never block on psutil"""
+
+    _lock = threading.Lock()
+    _thread: Optional[threading.Thread] = None
+    # Replaced wholesale by the sampler, so reads need no lock
+    _last_percent: Optional[List[float]] = None
+    _last_freq = None
 
     @classmethod
-    def _parse_sysctl_line(cls, line: str) -> Optional[float]:
-        """Parse temperature from sysctl output line"""
-        try:
-            temp_str = line.split(':')[-1].strip()
-            return float(temp_str)
-        except (ValueError, IndexError):
-            pass
-        return None
+    def start(cls) -> None:
+        """Start the background sampler thread if it is not already running"""
+        if cls._thread is not None and cls._thread.is_alive():
+            return
+
+        with cls._lock:
+            if cls._thread is not None and cls._thread.is_alive():
+                return
+            cls._thread = threading.Thread(target=cls._run, name='cpu-sampler', daemon=True)
+            cls._thread.start()
+
+    @classmethod
+    def _run(cls) -> None:
+        """Continuously sample per-CPU usage and frequency over the configured interval"""
+        while True:
+            try:
+                cls._last_percent = psutil.cpu_percent(interval=Config.CPU_SAMPLE_INTERVAL, percpu=True)
+                cls._last_freq = psutil.cpu_freq()
+            except Exception as e:
+                logger.warning(f"CPU sampler failed: {e}")
+                time.sleep(Config.CPU_SAMPLE_INTERVAL)
+
+    @classmethod
+    def get_cpu_percent(cls) -> List[float]:
+        """Get the latest per-CPU usage without blocking"""
+        cls.start()
+        percent = cls._last_percent
+        if percent is not None:
+            return percent
+
+        # The sampler has not completed its first interval yet
+        return psutil.cpu_percent(interval=None, percpu=True)  # type: ignore
+
+    @classmethod
+    def get_cpu_freq(cls):
+        """Get the latest CPU frequency reading without blocking"""
+        cls.start()
+        freq = cls._last_freq
+        if freq is not None:
+            return freq
+
+        return psutil.cpu_freq()
 
 # System Information Collector
 class SystemInfoCollector:
     """Collects and organizes system information"""
 
+    # Pseudo or read-only image filesystems that never have meaningful usage
+    SKIP_FSTYPES = frozenset(['', 'squashfs', 'overlay', 'tmpfs', 'devtmpfs', 'proc', 'sysfs'])
+
+    # Local fixed disks only (DriveType 3), skipping network and removable drives
+    LOGICAL_DISK_QUERY = "SELECT Name, Size, FreeSpace, FileSystem FROM Win32_LogicalDisk WHERE DriveType = 3"
+
+    # Mountpoints whose disk_usage call timed out, mapped to that still-running call
+    _stalled_mounts: Dict[str, Future] = {}
+    _stalled_mounts_lock = threading.Lock()
+
     @staticmethod
     def get_cpu_info() -> Optional[Dict[str, Any]]:
         """Get comprehensive CPU information"""
         try:
+            physical, logical = get_cpu_counts()
             cpu_info = {
-                'cpu_count_physical': psutil.cpu_count(logical=False),
-                'cpu_count_logical': psutil.cpu_count(logical=True),
-                'cpu_percent': psutil.cpu_percent(interval=1, percpu=True)
+                'cpu_count_physical': physical,
+                'cpu_count_logical': logical,
+                'cpu_percent': CPUSampler.get_cpu_percent()
             }
 
             # Get CPU frequency
-            freq = psutil.cpu_freq()
+            freq = CPUSampler.get_cpu_freq()
             if freq:
                 cpu_info['cpu_freq'] = {
                     'current': freq.current,
@@ -533,22 +830,35 @@ class SystemInfoCollector:
             return None
 
     @staticmethod
-    def get_disk_info() -> Optional[List[Dict[str, Any]]]:
-        """Get disk information"""
+    def get_disk_info(include_all: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """Get disk information, optionally including pseudo and removable filesystems"""
         try:
             disk_info = []
-            partitions = psutil.disk_partitions(all=True)
-            logger.info(f"Found {len(partitions)} disk partitions")
+            # Skip partitions without mountpoints and, unless asked for, removable/pseudo media
+            partitions = [p for p in get_disk_partitions(all_partitions=include_all)
+                          if p.mountpoint and (include_all or not SystemInfoCollector._should_skip_partition(p))]
+
+            # Leave hung mounts alone until their earlier call returns; every resubmission
+            # would tie up another disk_usage_pool worker
+            stalled = SystemInfoCollector._stalled_mounts
+            with SystemInfoCollector._stalled_mounts_lock:
+                for mountpoint in [m for m, pending in stalled.items() if pending.done()]:
+                    del stalled[mountpoint]
+                partitions = [p for p in partitions if p.mountpoint not in stalled]
+
+            # Query usage for all partitions concurrently so one slow mount doesn't stall the rest
+            futures = {disk_usage_pool.submit(psutil.disk_usage, p.mountpoint): p for p in partitions}
+            done, _ = wait(futures, timeout=Config.DISK_USAGE_TIMEOUT)
+
+            for future, partition in futures.items():
+                if future not in done:
+                    logger.warning("Timed out getting usage for %s", partition.mountpoint)
+                    with SystemInfoCollector._stalled_mounts_lock:
+                        stalled[partition.mountpoint] = future
+                    continue
 
-            for partition in partitions:
                 try:
-                    # Skip partitions without mountpoints
-                    if not partition.mountpoint:
-                        continue
-
-                    logger.info(f"Processing partition: {partition.device} -> {partition.mountpoint}")
-
-                    usage = psutil.disk_usage(partition.mountpoint)
+                    usage = future.result()
                     disk_info.append({
                         'device': partition.device,
                         'mountpoint': partition.mountpoint,
@@ -558,27 +868,31 @@ class SystemInfoCollector:
                         'free': usage.free,
                         'percent': usage.percent
                     })
-                    logger.info(f"Added disk info for {partition.mountpoint}: {usage.percent}% used")
 
                 except (PermissionError, FileNotFoundError, OSError) as e:
-                    logger.warning(f"Could not get usage for {partition.mountpoint}: {e}")
+                    logger.warning("Could not get usage for %s: %s", partition.mountpoint, e)
                     continue
                 except Exception as e:
-                    logger.warning(f"Unexpected error processing partition {partition.mountpoint}: {e}")
+                    logger.warning("Unexpected error processing partition %s: %s", partition.mountpoint, e)
                     continue
 
             # If no disk info was collected, try to get basic disk usage for common drives
             if not disk_info:
-                logger.info("No disk partitions found, trying common drive letters")
                 disk_info.extend(SystemInfoCollector._get_common_disk_usage())
 
-            logger.info(f"Returning {len(disk_info)} disk information entries")
             return disk_info
 
         except Exception as e:
             logger.error(f"Error getting disk info: {e}")
             return None
 
+    @staticmethod
+    def _should_skip_partition(partition) -> bool:
+        """Check if a partition is optical media, a snap image or a pseudo filesystem"""
+        return ('cdrom' in partition.opts or
+                partition.fstype in SystemInfoCollector.SKIP_FSTYPES or
+                partition.mountpoint.startswith('/snap/'))
+
     @staticmethod
     def _get_common_disk_usage() -> List[Dict[str, Any]]:
         """Get disk usage for common drive letters when normal detection fails"""
@@ -586,12 +900,10 @@ class SystemInfoCollector:
 
         # Try to get disk usage using WMI instead of psutil for Windows
         try:
-            pythoncom.CoInitialize()
-            import wmi
-            wmi_instance = wmi.WMI()
+            wmi_instance = get_wmi_instance()
 
             # Get logical disk information from WMI
-            for logical_disk in wmi_instance.Win32_LogicalDisk():
+            for logical_disk in wmi_instance.query(SystemInfoCollector.LOGICAL_DISK_QUERY):
                 try:
                     if logical_disk.Size:  # Only process drives with valid size
                         drive_letter = logical_disk.Name
@@ -653,41 +965,51 @@ def get_cpu_info() -> Optional[Dict[str, Any]]:
     """Legacy function for backward compatibility"""
     return SystemInfoCollector.get_cpu_info()
 
+# CPU name cleanup patterns, compiled once at import
+CPU_GENERATION_PREFIX_RE = re.compile(r'^\d+(?:st|nd|rd|th)\s+G(?:en|eneration)?\s+')
+CPU_TRADEMARK_RE = re.compile(r'\((?:R|TM)\)', re.IGNORECASE)
+# Single-character trademark glyphs are dropped with a translate table rather than a regex
+CPU_TRADEMARK_GLYPHS = str.maketrans('', '', '®™©')
+INTEL_SERIES_RE = re.compile(r'\b(i\d+)([^-])')
+CPU_GENERATION_RE = re.compile(r'(\d+)(?:th|st|nd|rd)')
+MOBILE_CPU_RE = re.compile(r'laptop|mobile| m ', re.IGNORECASE)
+ZEN4_SERIES_RE = re.compile(r'Ryzen [789]')
+
+# Intel codenames keyed by generation number
+INTEL_CODENAMES = {
+    '13': 'Raptor Lake', '14': 'Meteor Lake', '15': 'Arrow Lake',
+    '12': 'Broadwell', '11': 'Haswell', '10': 'Ivy Bridge',
+    '9': 'Sandy Bridge', '7': 'Nehalem', '6': 'Core', '4': 'NetBurst'
+}
+
+@lru_cache(maxsize=32)
 def process_cpu_name(name, generation=None, manufacturer='Intel'):
     """Process CPU name: clean, format, and get codename"""
     if not name:
         return name, 'Unknown'
 
-    # Clean name - remove generation prefixes and trademarks
-    cleaned = re.sub(r'^\d+(?:st|nd|rd|th)\s+G(?:en|eneration)?\s+|[®™©®®™®©®™©®®™®©®™©]', '', name)
-
-    # Remove registered/mark symbols
-    cleaned = re.sub(r'\(R\)|\(TM\)', '', cleaned, flags=re.IGNORECASE)
+    # Clean name - remove generation prefixes, trademarks and registered/mark symbols
+    cleaned = CPU_TRADEMARK_RE.sub('', CPU_GENERATION_PREFIX_RE.sub('', name).translate(CPU_TRADEMARK_GLYPHS))
 
     # Replace GenuineIntel with Intel
     final_name = cleaned.replace('GenuineIntel', 'Intel').strip()
 
     # Add hyphen for Intel i-series: i9 -> i9-
     if manufacturer == 'Intel' and 'Intel' in final_name:
-        final_name = re.sub(r'\b(i\d+)([^-])', r'\1-\2', final_name)
+        final_name = INTEL_SERIES_RE.sub(r'\1-\2', final_name)
 
     # Get codename if generation is available
     codename = 'Unknown'
     if generation and 'Intel' in manufacturer:
         gen_num = generation.split('th')[0] if 'th' in generation else None
-        intel_codenames = {
-            '13': 'Raptor Lake', '14': 'Meteor Lake', '15': 'Arrow Lake',
-            '12': 'Broadwell', '11': 'Haswell', '10': 'Ivy Bridge',
-            '9': 'Sandy Bridge', '7': 'Nehalem', '6': 'Core', '4': 'NetBurst'
-        }
-        codename = intel_codenames.get(gen_num, f'Gen {gen_num}' if gen_num else 'Unknown') if gen_num else 'Unknown'  # type: ignore
+        codename = INTEL_CODENAMES.get(gen_num, f'Gen {gen_num}') if gen_num else 'Unknown'
 
         # Add mobile suffix for laptop CPUs
-        if any(term in cleaned.lower() for term in ['laptop', 'mobile', ' m ']):
+        if MOBILE_CPU_RE.search(cleaned):
             codename += ' (Mobile)'
 
     elif generation and 'AMD' in manufacturer:
-        if any(series in name for series in ['Ryzen 9', 'Ryzen 8', 'Ryzen 7']):
+        if ZEN4_SERIES_RE.search(name):
             codename = 'Zen 4'
         else:
             codename = 'Zen Architecture'
@@ -706,6 +1028,18 @@ class NetworkUtils:
         'https://httpbin.org/ip'
     ]
 
+    _refresh_lock = threading.Lock()
+    _refresh_thread: Optional[threading.Thread] = None
+
+    # Interface name prefixes for Docker and libvirt virtual adapters
+    # (Hyper-V vEthernet is not skipped: an external switch moves the host's address onto it)
+    VIRTUAL_INTERFACE_PREFIXES = ('docker', 'veth', 'br-', 'virbr')
+
+    # Shared session so repeat lookups reuse pooled keep-alive connections
+    _session = requests.Session()
+    _session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    _session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
     @staticmethod
     def normalize_ip_response(service_url: str, data: Dict[str, Any]) -> Dict[str, str]:
         """Normalize IP response from different APIs"""
@@ -752,46 +1086,95 @@ class NetworkUtils:
         """Fetch IP info with caching and exponential backoff"""
         global ip_cache
 
-        # Check cache first
-        if ip_cache['data'] and time.time() - ip_cache['timestamp'] < Config.CACHE_DURATION:
+        # Check cache first; failed lookups are cached too, for a shorter time
+        if ip_cache['data'] and time.time() < ip_cache['expires']:
             return ip_cache['data']
 
-        for service_url in NetworkUtils.IP_SERVICES:
-            for attempt in range(Config.MAX_RETRIES):
-                try:
-                    response = requests.get(service_url, timeout=Config.REQUEST_TIMEOUT)
-                    if response.status_code == 200:
-                        ip_data = NetworkUtils.normalize_ip_response(service_url, response.json())
-                        ip_cache['data'] = ip_data
-                        ip_cache['timestamp'] = time.time()
-                        return ip_data
-                    elif response.status_code == 429:  # Rate limited
-                        time.sleep(2 ** attempt)
-                        continue
-                except requests.exceptions.RequestException:
+        return NetworkUtils._refresh_ip_cache()
+
+    @staticmethod
+    def _refresh_ip_cache() -> Dict[str, Any]:
+        """Query the IP services and store the result in ip_cache"""
+        # Query every service at once and keep whichever answers first
+        pending = {ip_lookup_pool.submit(NetworkUtils._query_ip_service, url) for url in NetworkUtils.IP_SERVICES}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                ip_data = future.result()
+                if ip_data is not None:
+                    for other in pending:
+                        other.cancel()
+                    now = time.time()
+                    with ip_cache_lock:
+                        ip_cache.update(data=ip_data, timestamp=now, expires=now + Config.CACHE_DURATION)
+                    return ip_data
+
+        # Don't hit every service again until the failure TTL runs out; keep any earlier
+        # successful lookup, since a stale public IP beats the local fallback
+        with ip_cache_lock:
+            if ip_cache['data'] is None or ip_cache['data'].get('source') == 'local':
+                logger.warning("All IP services failed, using local fallback")
+                ip_cache['data'] = NetworkUtils.get_basic_local_ip_info()
+            else:
+                logger.warning("All IP services failed, keeping the previous lookup")
+            ip_cache['expires'] = time.time() + Config.IP_FAILURE_CACHE_DURATION
+            return ip_cache['data']
+
+    @staticmethod
+    def _query_ip_service(service_url: str) -> Optional[Dict[str, str]]:
+        """Query a single IP service with exponential backoff, returning None if it never succeeds"""
+        for attempt in range(Config.MAX_RETRIES):
+            try:
+                response = NetworkUtils._session.get(service_url, timeout=(Config.REQUEST_CONNECT_TIMEOUT, Config.REQUEST_TIMEOUT))
+                if response.status_code == 200:
+                    return NetworkUtils.normalize_ip_response(service_url, response.json())
+                elif response.status_code == 429:  # Rate limited
                     time.sleep(2 ** attempt)
+                    continue
+            except (requests.exceptions.RequestException, ValueError):
+                time.sleep(2 ** attempt)
+        return None
+
+    @classmethod
+    def start_ip_refresher(cls) -> None:
+        """Start the background IP info refresher if it is not already running"""
+        if cls._refresh_thread is not None and cls._refresh_thread.is_alive():
+            return
+
+        with cls._refresh_lock:
+            if cls._refresh_thread is not None and cls._refresh_thread.is_alive():
+                return
+            cls._refresh_thread = threading.Thread(target=cls._ip_refresh_loop, name='ip-refresher', daemon=True)
+            cls._refresh_thread.start()
+
+    @classmethod
+    def _ip_refresh_loop(cls) -> None:
+        """Keep ip_cache populated; the refresh itself only hits the network once the cache expires"""
+        while True:
+            try:
+                cls.fetch_ip_info_with_retry()
+            except RuntimeError:
+                # ip_lookup_pool refuses new work once the interpreter is shutting down
+                return
+            except Exception as e:
+                logger.warning(f"IP info refresher failed: {e}")
+            time.sleep(Config.IP_REFRESH_INTERVAL)
+
+    @staticmethod
+    def get_cached_ip_info() -> Dict[str, Any]:
+        """Get the last fetched IP info without waiting on external services"""
+        ip_data = ip_cache['data']
+        if ip_data is not None:
+            return ip_data
 
-        logger.warning("All IP services failed, using local fallback")
+        # No successful lookup yet
         return NetworkUtils.get_basic_local_ip_info()
 
     @staticmethod
     def get_basic_local_ip_info() -> Dict[str, Any]:
         """Get basic local IP information when external services fail"""
         try:
-            local_ipv4 = None
-            local_ipv6 = None
-
-            # Get local IPv4 and IPv6 addresses
-            for interface, addrs in psutil.net_if_addrs().items():
-                for addr in addrs:
-                    if addr.family.name == 'AF_INET' and addr.address and not addr.address.startswith('127.'):
-                        local_ipv4 = addr.address
-                        break
-                    elif addr.family.name == 'AF_INET6' and addr.address and not addr.address.startswith('fe80') and not addr.address.startswith('::1'):
-                        local_ipv6 = addr.address
-                        break
-                if local_ipv4 and local_ipv6:
-                    break
+            local_ipv4, local_ipv6 = NetworkUtils._find_local_addresses()
 
             return {
                 'ip': local_ipv4 or '127.0.0.1',
@@ -819,17 +1202,30 @@ class NetworkUtils:
         """Get detailed network information"""
         try:
             net_io = psutil.net_io_counters(pernic=False)  # type: ignore
-            ip_info = NetworkUtils.fetch_ip_info_with_retry()
+            # reset_io swaps in a whole new dict, so one read gives a consistent set of offsets
+            offsets = io_offsets
+            ip_info = NetworkUtils.get_cached_ip_info()
             local_ipv6 = None
 
             # Get IPv6 from local interfaces if needed
             if not ip_info or ip_info.get('error') or (ip_info.get('ip') and ':' not in ip_info.get('ip', '')):
-                local_ipv6 = NetworkUtils._get_local_ipv6()
+                if ip_info and 'local_ipv6' in ip_info:
+                    # The local fallback already scanned the interfaces, don't enumerate them again
+                    local_ipv6 = ip_info['local_ipv6']
+                else:
+                    local_ipv6 = NetworkUtils._get_local_ipv6()
 
             # Apply offsets for reset functionality
-            net_io_dict = net_io._asdict()
-            for key in io_offsets:
-                net_io_dict[key] = max(0, net_io_dict[key] - io_offsets[key])
+            net_io_dict = {
+                'bytes_sent': max(0, net_io.bytes_sent - offsets['bytes_sent']),
+                'bytes_recv': max(0, net_io.bytes_recv - offsets['bytes_recv']),
+                'packets_sent': max(0, net_io.packets_sent - offsets['packets_sent']),
+                'packets_recv': max(0, net_io.packets_recv - offsets['packets_recv']),
+                'errin': net_io.errin,
+                'errout': net_io.errout,
+                'dropin': net_io.dropin,
+                'dropout': net_io.dropout
+            }
 
             return {
                 'io_counters': net_io_dict,
@@ -844,14 +1240,50 @@ class NetworkUtils:
     def _get_local_ipv6() -> Optional[str]:
         """Get local IPv6 address"""
         try:
-            for interface, addrs in psutil.net_if_addrs().items():
-                for addr in addrs:
-                    if addr.family.name == 'AF_INET6' and addr.address and not addr.address.startswith('fe80'):
-                        return addr.address
+            return NetworkUtils._find_local_addresses()[1]
         except Exception as e:
             logger.warning(f"Could not get local IPv6: {e}")
         return None
 
+    @staticmethod
+    def _find_local_addresses() -> Tuple[Optional[str], Optional[str]]:
+        """Find the first non-loopback, non-link-local IPv4 and IPv6 addresses in one pass"""
+        local_ipv4 = None
+        local_ipv6 = None
+        for interface, addrs in get_net_if_addrs().items():
+            # Container bridges and virtual switches never carry the host's own address
+            if interface.startswith(NetworkUtils.VIRTUAL_INTERFACE_PREFIXES):
+                continue
+
+            for addr in addrs:
+                if addr.family == socket.AF_INET:
+                    if local_ipv4 is not None:
+                        continue
+                elif addr.family == socket.AF_INET6:
+                    if local_ipv6 is not None:
+                        continue
+                else:
+                    # AF_LINK / AF_PACKET hardware addresses
+                    continue
+                if not addr.address:
+                    continue
+
+                try:
+                    # Scoped IPv6 addresses carry a %interface suffix
+                    ip = ipaddress.ip_address(addr.address.split('%', 1)[0])
+                except ValueError:
+                    continue
+                if ip.is_loopback or ip.is_link_local:
+                    continue
+
+                if ip.version == 4:
+                    local_ipv4 = addr.address
+                else:
+                    local_ipv6 = addr.address
+                if local_ipv4 and local_ipv6:
+                    return local_ipv4, local_ipv6
+        return local_ipv4, local_ipv6
+
 # Hardware Detection Module
 class HardwareDetector:
     """Handles hardware detection and information gathering"""
@@ -867,9 +1299,83 @@ class HardwareDetector:
         'ETHERNET', 'GBE', 'PCIE GBE', 'LAN', 'ETHERNET CONTROLLER'
     ]
 
+    # Keyword lists folded into one substring search each
+    WIFI_KEYWORDS_RE = re.compile('|'.join(map(re.escape, WIFI_KEYWORDS)))
+    ETHERNET_KEYWORDS_RE = re.compile('|'.join(map(re.escape, ETHERNET_KEYWORDS)))
+
+    # Vendor prefixes and punctuation ignored when matching WMI GPU names against NVML
+    GPU_KEY_STRIP_RE = re.compile(r'\b(?:NVIDIA|GEFORCE)\b|[^A-Z0-9]')
+
+    # WQL queries selecting only the properties that are read
+    PROCESSOR_QUERY = "SELECT Name, Manufacturer, NumberOfCores, NumberOfLogicalProcessors FROM Win32_Processor"
+    VIDEO_CONTROLLER_QUERY = "SELECT Name, DriverVersion, Status, AdapterRAM FROM Win32_VideoController"
+    BASEBOARD_QUERY = "SELECT Manufacturer, Product, SerialNumber FROM Win32_BaseBoard"
+    NETWORK_ADAPTER_QUERY = ("SELECT Name, Description, Manufacturer, DeviceID, MACAddress, Speed, Status, "
+                             "PhysicalAdapter, NetEnabled FROM Win32_NetworkAdapter "
+                             "WHERE PhysicalAdapter = TRUE AND NetEnabled = TRUE")
+
     @staticmethod
     def get_hardware_info() -> Dict[str, Any]:
-        """Get comprehensive hardware information"""
+        """Get comprehensive hardware information, cached since it rarely changes at runtime"""
+        if HardwareDetector._is_cache_fresh():
+            # GPU status and memory are the only fields worth refreshing between full rebuilds;
+            # like the full rebuild, re-query them off the request path
+            if (time.monotonic() - hardware_cache['gpu_timestamp'] >= Config.GPU_REFRESH_INTERVAL and
+                    not hardware_cache_lock.locked()):
+                collector_pool.submit(HardwareDetector._refresh_gpu_info)
+            return hardware_cache['data']
+
+        if hardware_cache['data'] is not None:
+            # Expired: keep serving the old info and re-run the WMI queries off the request path
+            if not hardware_cache_lock.locked():
+                collector_pool.submit(HardwareDetector._refresh_hardware_info)
+            return hardware_cache['data']
+
+        # Nothing cached yet, so wait for the first collection
+        return HardwareDetector._refresh_hardware_info()
+
+    @staticmethod
+    def _refresh_hardware_info() -> Dict[str, Any]:
+        """Collect hardware info into hardware_cache unless another thread already did"""
+        with hardware_cache_lock:
+            # Another thread may have populated the cache while we waited
+            if HardwareDetector._is_cache_fresh():
+                return hardware_cache['data']
+
+            hardware_info, success = HardwareDetector._collect_hardware_info()
+            if success:
+                hardware_cache['data'] = hardware_info
+                hardware_cache['timestamp'] = hardware_cache['gpu_timestamp'] = time.monotonic()
+            return hardware_info
+
+    @staticmethod
+    def _is_cache_fresh() -> bool:
+        """Check if the cached hardware info is still valid"""
+        return (hardware_cache['data'] is not None and
+                time.monotonic() - hardware_cache['timestamp'] < Config.HARDWARE_CACHE_DURATION)
+
+    @staticmethod
+    def _refresh_gpu_info() -> None:
+        """Re-query only the GPU entries, reusing the cached processor, motherboard and WiFi info"""
+        with hardware_cache_lock:
+            if time.monotonic() - hardware_cache['gpu_timestamp'] < Config.GPU_REFRESH_INTERVAL:
+                return
+            # Stamp first so a failing query isn't retried on every request
+            hardware_cache['gpu_timestamp'] = time.monotonic()
+
+            try:
+                gpu_info = HardwareDetector._get_gpu_info(get_wmi_instance())
+            except Exception as e:
+                logger.error(f"Could not refresh GPU info via WMI: {e}")
+                return
+
+            # Swap in a new dict so readers never see a half-updated one
+            if gpu_info:
+                hardware_cache['data'] = {**hardware_cache['data'], 'gpu': gpu_info}
+
+    @staticmethod
+    def _collect_hardware_info() -> Tuple[Dict[str, Any], bool]:
+        """Query WMI for hardware information, returning the info and whether WMI succeeded"""
         hardware_info = {
             'gpu': [],
             'motherboard': {},
@@ -878,9 +1384,7 @@ class HardwareDetector:
         }
 
         try:
-            pythoncom.CoInitialize()
-            import wmi
-            wmi_instance = wmi.WMI()
+            wmi_instance = get_wmi_instance()
 
             # Get processor info
             hardware_info['processor'] = HardwareDetector._get_processor_info(wmi_instance)
@@ -896,20 +1400,22 @@ class HardwareDetector:
 
         except ImportError:
             logger.warning("WMI module not found. Hardware info will be limited.")
+            return hardware_info, False
         except Exception as e:
             logger.error(f"An error occurred during WMI initialization or query: {e}")
+            return hardware_info, False
 
-        return hardware_info
+        return hardware_info, True
 
     @staticmethod
     def _get_processor_info(wmi_instance) -> Dict[str, Any]:
         """Get processor information"""
         try:
-            processor = wmi_instance.Win32_Processor()[0]
+            processor = wmi_instance.query(HardwareDetector.PROCESSOR_QUERY)[0]
             cpu_name = processor.Name.strip()
 
             # Extract generation
-            generation_match = re.search(r'(\d+)(?:th|th\s+Gen|st|st\s+Gen|nd|nd\s+Gen|rd|rd\s+Gen)', cpu_name)
+            generation_match = CPU_GENERATION_RE.search(cpu_name)
             generation = generation_match.group(1) + 'th Gen' if generation_match else None
 
             manufacturer = processor.Manufacturer or 'Intel'
@@ -930,36 +1436,32 @@ class HardwareDetector:
     @staticmethod
     def _get_gpu_info(wmi_instance) -> List[Dict[str, Any]]:
         """Get GPU information"""
-        gpu_info = []
-
         try:
-            # Get NVIDIA GPU memory info if available
-            nvidia_memory = get_nvidia_gpu_memory()
-
-            for gpu in wmi_instance.Win32_VideoController():
-                adapter_ram = gpu.AdapterRAM
-
-                # Use NVML data for NVIDIA GPUs if WMI data is invalid
-                if (gpu.Name and 'NVIDIA' in gpu.Name.upper() and
-                    (adapter_ram is None or adapter_ram <= 0) and nvidia_memory):
-                    adapter_ram = HardwareDetector._match_nvidia_memory(gpu.Name, nvidia_memory)
-
-                gpu_info.append({
-                    'name': gpu.Name,
-                    'driver_version': gpu.DriverVersion,
-                    'status': gpu.Status,
-                    'adapter_ram': adapter_ram
-                })
+            return [{
+                'name': gpu.Name,
+                'driver_version': gpu.DriverVersion,
+                'status': gpu.Status,
+                'adapter_ram': HardwareDetector._resolve_adapter_ram(gpu.Name, gpu.AdapterRAM)
+            } for gpu in wmi_instance.query(HardwareDetector.VIDEO_CONTROLLER_QUERY)]
         except Exception as e:
             logger.error(f"Could not retrieve GPU info via WMI: {e}")
+            return []
 
-        return gpu_info
+    @staticmethod
+    def _resolve_adapter_ram(gpu_name: Optional[str], adapter_ram: Optional[int]) -> Optional[int]:
+        """Use NVML memory for NVIDIA GPUs whose WMI AdapterRAM is invalid"""
+        if gpu_name and 'NVIDIA' in gpu_name.upper() and (adapter_ram is None or adapter_ram <= 0):
+            # Only consulted when needed; the NVML totals are cached for the process lifetime
+            nvidia_memory = get_nvidia_gpu_memory()
+            if nvidia_memory:
+                return HardwareDetector._match_nvidia_memory(gpu_name, nvidia_memory)
+        return adapter_ram
 
     @staticmethod
     def _get_motherboard_info(wmi_instance) -> Dict[str, Any]:
         """Get motherboard information"""
         try:
-            board = wmi_instance.Win32_BaseBoard()[0]
+            board = wmi_instance.query(HardwareDetector.BASEBOARD_QUERY)[0]
             return {
                 'manufacturer': board.Manufacturer,
                 'product': board.Product,
@@ -975,7 +1477,7 @@ class HardwareDetector:
         wifi_adapters = []
 
         try:
-            for adapter in wmi_instance.Win32_NetworkAdapter():
+            for adapter in wmi_instance.query(HardwareDetector.NETWORK_ADAPTER_QUERY):
                 if HardwareDetector._is_physical_wifi_adapter(adapter):
                     adapter_info = HardwareDetector._extract_adapter_info(adapter)
                     if adapter_info:
@@ -1007,11 +1509,11 @@ class HardwareDetector:
         if not (is_physical and is_enabled):
             return False
 
-        adapter_name = adapter.Name or adapter.Description or 'Unknown'
+        adapter_name = (adapter.Name or adapter.Description or 'Unknown').upper()
 
         # Check if it's WiFi (not Ethernet)
-        is_ethernet = any(keyword in adapter_name.upper() for keyword in HardwareDetector.ETHERNET_KEYWORDS)
-        is_wifi = (any(keyword in adapter_name.upper() for keyword in HardwareDetector.WIFI_KEYWORDS)
+        is_ethernet = HardwareDetector.ETHERNET_KEYWORDS_RE.search(adapter_name) is not None
+        is_wifi = (HardwareDetector.WIFI_KEYWORDS_RE.search(adapter_name) is not None
                   and not is_ethernet and adapter.MACAddress)
 
         return is_wifi
@@ -1043,12 +1545,22 @@ class HardwareDetector:
         except Exception:
             return None
 
+    @staticmethod
+    def normalize_gpu_key(gpu_name: str) -> str:
+        """Reduce a GPU name to a comparable key, e.g. 'NVIDIA GeForce RTX 4070' -> 'RTX4070'"""
+        return HardwareDetector.GPU_KEY_STRIP_RE.sub('', gpu_name.upper())
+
     @staticmethod
     def _match_nvidia_memory(gpu_name: str, nvidia_memory: Dict[str, int]) -> Optional[int]:
         """Match GPU name with NVIDIA memory info"""
         if not nvidia_memory:
             return None
 
+        # WMI and NVML normally report the same model name, so try an exact key lookup first
+        nv_memory = get_nvidia_memory_by_key().get(HardwareDetector.normalize_gpu_key(gpu_name))
+        if nv_memory is not None:
+            return nv_memory
+
         gpu_name_upper = gpu_name.upper()
 
         for nv_name, nv_memory in nvidia_memory.items():
@@ -1067,9 +1579,9 @@ def get_memory_info() -> Optional[Dict[str, Any]]:
     """Legacy function for backward compatibility"""
     return SystemInfoCollector.get_memory_info()
 
-def get_disk_info() -> Optional[List[Dict[str, Any]]]:
+def get_disk_info(include_all: bool = False) -> Optional[List[Dict[str, Any]]]:
     """Legacy function for backward compatibility"""
-    return SystemInfoCollector.get_disk_info()
+    return SystemInfoCollector.get_disk_info(include_all)
 
 def _normalize_ip_response(service_url: str, data: Dict[str, Any]) -> Dict[str, str]:
     """Legacy function for backward compatibility"""
@@ -1091,24 +1603,62 @@ def get_hardware_info() -> Dict[str, Any]:
     """Legacy function for backward compatibility"""
     return HardwareDetector.get_hardware_info()
 
-def get_nvidia_gpu_memory() -> Optional[Dict[str, int]]:
-    """Get NVIDIA GPU memory information using NVML"""
-    if not NVML_AVAILABLE:
+def dumps_json(obj: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def compress_json(body: bytes) -> Optional[bytes]:
+    """Gzip a serialized payload if it is large enough to benefit"""
+    if len(body) < Config.COMPRESS_MIN_SIZE:
         return None
+    return gzip.compress(body, compresslevel=Config.COMPRESS_LEVEL)
+
+def json_etag(body: bytes) -> str:
+    """Compute a cheap content hash for a serialized payload"""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+def json_bytes_response(body: bytes, gzip_body: Optional[bytes] = None, status: int = 200,
+                        etag: Optional[str] = None) -> Response:
+    """Build a JSON response from serialized bytes, gzipped when the client accepts it"""
+    # Weak ETag, since the same payload may be sent with different content encodings
+    if etag is not None and request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=True)
+        response.vary.add('Accept-Encoding')
+        return response
+
+    if len(body) >= Config.COMPRESS_MIN_SIZE and request.accept_encodings['gzip'] > 0:
+        response = Response(gzip_body or compress_json(body), status=status, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(body, status=status, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    if etag is not None:
+        response.set_etag(etag, weak=True)
+    return response
+
+def json_response(obj: Any, status: int = 200) -> Response:
+    """Build a JSON response without going through flask.jsonify"""
+    return json_bytes_response(dumps_json(obj), status=status)
+
+def _init_nvml() -> List[Tuple[str, Any]]:
+    """Initialize NVML once for the process and return (name, handle) pairs for each GPU"""
+    if not NVML_AVAILABLE:
+        return []
 
     try:
         pynvml.nvmlInit()
     except Exception:
         # NVML library not available (no NVIDIA GPU or driver not installed)
-        return None
+        return []
+    atexit.register(pynvml.nvmlShutdown)
 
+    handles = []
     try:
-        device_count = pynvml.nvmlDeviceGetCount()
-
-        gpu_memory_info = {}
-        for i in range(device_count):
+        for i in range(pynvml.nvmlDeviceGetCount()):
             handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-            info = pynvml.nvmlDeviceGetMemoryInfo(handle)
             name = pynvml.nvmlDeviceGetName(handle)
 
             # Handle different versions of nvidia-ml-py
@@ -1117,34 +1667,68 @@ def get_nvidia_gpu_memory() -> Optional[Dict[str, int]]:
             elif hasattr(name, '__str__'):
                 name = str(name)
 
-            gpu_memory_info[name] = info.total  # total memory in bytes
+            handles.append((name, handle))
+    except Exception as e:
+        logger.warning(f"Error enumerating NVIDIA GPUs: {e}")
+
+    return handles
+
+NVML_HANDLES = _init_nvml()
 
-        pynvml.nvmlShutdown()
-        return gpu_memory_info
+@lru_cache(maxsize=1)
+def get_nvidia_gpu_memory() -> Optional[Dict[str, int]]:
+    """Get NVIDIA GPU total memory via NVML, cached since it never changes"""
+    if not NVML_HANDLES:
+        return None
+
+    try:
+        # total memory in bytes
+        return {name: pynvml.nvmlDeviceGetMemoryInfo(handle).total for name, handle in NVML_HANDLES}
     except Exception as e:
         logger.warning(f"Error getting NVIDIA GPU memory: {e}")
-        try:
-            pynvml.nvmlShutdown()
-        except Exception:
-            pass
         return None
 
+@lru_cache(maxsize=1)
+def get_nvidia_memory_by_key() -> Dict[str, int]:
+    """Index NVIDIA GPU total memory by normalized name, built once from the cached NVML totals"""
+    return {HardwareDetector.normalize_gpu_key(name): total
+            for name, total in (get_nvidia_gpu_memory() or {}).items()}
 
-
+# Start background samplers
+CPUSampler.start()
+TemperatureDetector.start()
+NetworkUtils.start_ip_refresher()
+# Populate the hardware cache up front so the first request doesn't pay for the WMI queries
+collector_pool.submit(HardwareDetector.get_hardware_info)
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Simple health check endpoint"""
-    return jsonify({"status": "healthy", "timestamp": time.time()})
+    return json_response({"status": "healthy", "timestamp": time.time()})
 
-@app.route('/api/system-info', methods=['GET'])
-def system_info():
-    """Consolidated endpoint for system information"""
-    # Get hardware info for CPU core detection
-    hardware_data = get_hardware_info()
+def collect_result(future: Future, name: str, deadline: float) -> Any:
+    """Wait for a collector until the shared deadline, returning None if it runs late"""
+    try:
+        return future.result(timeout=max(0.0, deadline - time.monotonic()))
+    except FutureTimeoutError:
+        logger.warning(f"Timed out collecting {name} info")
+        return None
+
+def build_system_info(include_all_disks: bool = False) -> Dict[str, Any]:
+    """Collect the consolidated system information payload"""
+    # Fan out the independent collectors; each handles its own errors and returns None on failure.
+    # WMI-backed collectors initialize COM per worker thread via get_wmi_instance().
+    deadline = time.monotonic() + Config.COLLECTOR_TIMEOUT
+    cpu_future = collector_pool.submit(get_cpu_info)
+    memory_future = collector_pool.submit(get_memory_info)
+    disk_future = collector_pool.submit(get_disk_info, include_all_disks)
+    network_future = collector_pool.submit(get_network_info)
+
+    # Hardware info is refreshed in the background; use whatever is cached for core detection
+    hardware_data = hardware_cache['data']
 
     # Get CPU info
-    cpu_info = get_cpu_info()
+    cpu_info = collect_result(cpu_future, 'CPU', deadline)
     if cpu_info:
         # Detect core types using hardware info
         physical_cores = cpu_info.get('cpu_count_physical', 0)
@@ -1154,29 +1738,152 @@ def system_info():
 
     data = {
         'cpu': cpu_info,
-        'memory': get_memory_info(),
-        'disk': get_disk_info(),
-        'network': get_network_info(),
-        'platform': {
-            'system': platform.system(),
-            'release': platform.release(),
-            'version': platform.version(),
-            'windows_version': 'Windows 11' if int(platform.version().split('.')[-1]) >= 22000 else 'Windows 10',
-            'architecture': platform.machine(),
-            'processor': platform.processor()
-        }
+        'memory': collect_result(memory_future, 'memory', deadline),
+        'disk': collect_result(disk_future, 'disk', deadline),
+        'network': collect_result(network_future, 'network', deadline),
+        'platform': PLATFORM_INFO
     }
     # Filter out None values if a function fails
-    data = {k: v for k, v in data.items() if v is not None}
+    return {k: v for k, v in data.items() if v is not None}
+
+def get_system_info_snapshot() -> Optional[Dict[str, Any]]:
+    """Get the serialized system information, rebuilding it at most once per TTL"""
+    system_info_cache['last_request'] = time.monotonic()
+    start_snapshot_refresher()
+
+    snapshot = system_info_cache['snapshot']
+    if time.monotonic() - system_info_cache['timestamp'] < Config.SYSTEM_INFO_CACHE_TTL:
+        return snapshot
+
+    if snapshot is not None:
+        # Stale-while-revalidate: if another thread is already rebuilding, serve the previous snapshot
+        if not system_info_cache_lock.acquire(blocking=False):
+            return snapshot
+    else:
+        # Nothing to serve yet, so wait for the first build
+        system_info_cache_lock.acquire()
+
+    try:
+        # Another thread may have refreshed the snapshot while we waited
+        if time.monotonic() - system_info_cache['timestamp'] < Config.SYSTEM_INFO_CACHE_TTL:
+            return system_info_cache['snapshot']
+        return _rebuild_system_info_snapshot() or snapshot
+    finally:
+        system_info_cache_lock.release()
+
+def _rebuild_system_info_snapshot() -> Optional[Dict[str, Any]]:
+    """Collect, serialize, compress and hash the system information; caller holds system_info_cache_lock"""
+    data = build_system_info()
     if not data:
-        return jsonify({'error': 'Could not retrieve system information'}), 500
-    return jsonify(data)
+        return None
+
+    # Serialize, compress and hash once per TTL rather than once per request
+    body = dumps_json(data)
+    snapshot = {
+        'body': body,
+        'gzip_body': compress_json(body),
+        'etag': json_etag(body)
+    }
+    system_info_cache['snapshot'] = snapshot
+    system_info_cache['timestamp'] = time.monotonic()
+    return snapshot
+
+def start_snapshot_refresher() -> None:
+    """Start the background snapshot refresher if it is not already running"""
+    global snapshot_refresher_thread
+    if snapshot_refresher_thread is not None and snapshot_refresher_thread.is_alive():
+        return
+
+    with snapshot_refresher_lock:
+        if snapshot_refresher_thread is not None and snapshot_refresher_thread.is_alive():
+            return
+        snapshot_refresher_thread = threading.Thread(target=_snapshot_refresh_loop, name='snapshot-refresher',
+                                                     daemon=True)
+        snapshot_refresher_thread.start()
+
+def _snapshot_refresh_loop() -> None:
+    """Rebuild the snapshot just ahead of expiry while it is in demand; exit once nobody is polling"""
+    while time.monotonic() - system_info_cache['last_request'] < Config.SNAPSHOT_IDLE_TIMEOUT:
+        # Wake up shortly before the current snapshot expires
+        refresh_age = Config.SYSTEM_INFO_CACHE_TTL * 0.9
+        time.sleep(max(0.0, refresh_age - (time.monotonic() - system_info_cache['timestamp'])))
+
+        # Only build ahead for clients polling faster than the TTL; a slower poller would
+        # find the prefetched snapshot expired anyway, so let its request rebuild it
+        if system_info_cache['last_request'] <= system_info_cache['timestamp']:
+            time.sleep(Config.SYSTEM_INFO_CACHE_TTL)
+            continue
+
+        with system_info_cache_lock:
+            if time.monotonic() - system_info_cache['timestamp'] < refresh_age:
+                continue
+            try:
+                rebuilt = _rebuild_system_info_snapshot() is not None
+            except RuntimeError:
+                # collector_pool refuses new work once the interpreter is shutting down
+                return
+            except Exception as e:
+                logger.warning(f"Snapshot refresher failed: {e}")
+                rebuilt = False
+
+        if not rebuilt:
+            # The timestamp didn't move, so back off instead of retrying immediately
+            time.sleep(Config.SYSTEM_INFO_CACHE_TTL)
+
+@app.route('/api/system-info', methods=['GET'])
+def system_info():
+    """Consolidated endpoint for system information"""
+    if request.args.get('all') == '1':
+        # Diagnostic view including pseudo/removable filesystems, never cached
+        data = build_system_info(include_all_disks=True)
+        if not data:
+            return json_response({'error': 'Could not retrieve system information'}, 500)
+        return json_response(data)
+
+    snapshot = get_system_info_snapshot()
+    if snapshot is None:
+        return json_response({'error': 'Could not retrieve system information'}, 500)
+    return json_bytes_response(snapshot['body'], snapshot['gzip_body'], etag=snapshot['etag'])
+
+@app.route('/api/system-info/stream', methods=['GET'])
+def system_info_stream():
+    """Server-sent events stream of system information"""
+    with active_streams_lock:
+        if active_streams['count'] >= Config.MAX_STREAMS:
+            return json_response({'error': 'Too many open streams, poll /api/system-info instead'}, 503)
+        active_streams['count'] += 1
+
+    def release():
+        with active_streams_lock:
+            active_streams['count'] -= 1
+
+    def generate():
+        last_etag = None
+        last_sent = time.monotonic()
+        while True:
+            snapshot = get_system_info_snapshot()
+            # Only push when the payload actually changed
+            if snapshot is not None and snapshot['etag'] != last_etag:
+                last_etag = snapshot['etag']
+                last_sent = time.monotonic()
+                yield b'data: ' + snapshot['body'] + b'\n\n'
+            elif time.monotonic() - last_sent >= Config.STREAM_HEARTBEAT_INTERVAL:
+                # Comment line keeps idle connections from being dropped by proxies
+                last_sent = time.monotonic()
+                yield b':\n\n'
+            time.sleep(Config.STREAM_INTERVAL)
+
+    response = Response(generate(), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+    # The server closes the response when the client disconnects, even if the generator never started
+    response.call_on_close(release)
+    return response
 
 @app.route('/api/hardware-info', methods=['GET'])
 def hardware_info():
     """Endpoint for detailed hardware information"""
     info = get_hardware_info()
-    return jsonify(info)
+    return json_response(info)
 
 @app.route('/api/reset-io', methods=['POST'])
 def reset_io():
@@ -1184,14 +1891,26 @@ def reset_io():
     global io_offsets
     try:
         current_io = psutil.net_io_counters(pernic=False)  # type: ignore
-        io_offsets['bytes_sent'] = current_io.bytes_sent
-        io_offsets['bytes_recv'] = current_io.bytes_recv
-        io_offsets['packets_sent'] = current_io.packets_sent
-        io_offsets['packets_recv'] = current_io.packets_recv
-        return jsonify({'status': 'I/O counters reset'})
+        io_offsets = {
+            'bytes_sent': current_io.bytes_sent,
+            'bytes_recv': current_io.bytes_recv,
+            'packets_sent': current_io.packets_sent,
+            'packets_recv': current_io.packets_recv
+        }
+        # Expire the cached snapshot so the next poll shows the reset counters. Rebuilds run under
+        # the lock, so this waits out any rebuild that may have read the old offsets.
+        with system_info_cache_lock:
+            system_info_cache['timestamp'] = 0
+        return json_response({'status': 'I/O counters reset'})
     except Exception as e:
         logging.error(f"Error resetting I/O: {e}")
-        return jsonify({'error': 'Failed to reset I/O counters'}), 500
+        return json_response({'error': 'Failed to reset I/O counters'}, 500)
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    if os.environ.get('FLASK_DEV'):
+        # Development server with debugger and reloader
+        app.run(debug=True, host='0.0.0.0', port=5000)
+    else:
+        # Production WSGI server; waitress works on Windows where gunicorn can't fork
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=5000, threads=8)
@@ -0,0 +1,15 @@
+import os
+import sys
+import types
+
+# app.py imports pythoncom unconditionally; it only exists on Windows
+if 'pythoncom' not in sys.modules:
+    try:
+        import pythoncom  # noqa: F401
+    except ImportError:
+        pythoncom = types.ModuleType('pythoncom')
+        pythoncom.CoInitialize = lambda: None
+        pythoncom.com_error = OSError
+        sys.modules['pythoncom'] = pythoncom
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,59 @@
+import threading
+from collections import namedtuple
+
+import pytest
+
+import app
+
+Partition = namedtuple('Partition', 'device mountpoint fstype opts')
+Usage = namedtuple('Usage', 'total used free percent')
+
+HEALTHY = Partition('/dev/sda1', '/', 'ext4', 'rw')
+HUNG = Partition('server:/export', '/mnt/hung', 'nfs', 'rw')
+
+
+@pytest.fixture
+def hung_mount(monkeypatch):
+    """Patch disk_usage so /mnt/hung blocks until released; yields the per-mount call counts"""
+    release = threading.Event()
+    calls = {HEALTHY.mountpoint: 0, HUNG.mountpoint: 0}
+
+    def disk_usage(mountpoint):
+        calls[mountpoint] += 1
+        if mountpoint == HUNG.mountpoint:
+            release.wait()
+        return Usage(100, 40, 60, 40.0)
+
+    monkeypatch.setattr(app, 'get_disk_partitions', lambda all_partitions=False: [HEALTHY, HUNG])
+    monkeypatch.setattr(app.psutil, 'disk_usage', disk_usage)
+    monkeypatch.setattr(app.Config, 'DISK_USAGE_TIMEOUT', 0.05)
+    monkeypatch.setattr(app.SystemInfoCollector, '_get_common_disk_usage', staticmethod(lambda: []))
+    monkeypatch.setattr(app.SystemInfoCollector, '_stalled_mounts', {})
+
+    calls['release'] = release
+    yield calls
+    release.set()
+
+
+def test_hung_mount_is_not_resubmitted_while_its_call_is_outstanding(hung_mount):
+    for _ in range(5):
+        app.SystemInfoCollector.get_disk_info()
+
+    assert hung_mount[HUNG.mountpoint] == 1
+
+    # Once the hung call returns the mount is tried again
+    hung_mount['release'].set()
+    app.SystemInfoCollector._stalled_mounts[HUNG.mountpoint].result(timeout=1)
+    mountpoints = [d['mountpoint'] for d in app.SystemInfoCollector.get_disk_info()]
+
+    assert hung_mount[HUNG.mountpoint] == 2
+    assert HUNG.mountpoint in mountpoints
+
+
+def test_healthy_mounts_are_reported_while_another_mount_hangs(hung_mount):
+    # More calls than disk_usage_pool has workers, so resubmitting the hung mount would starve it
+    for _ in range(app.disk_usage_pool._max_workers * 2):
+        mountpoints = [d['mountpoint'] for d in app.SystemInfoCollector.get_disk_info()]
+        assert mountpoints == [HEALTHY.mountpoint]
+
+    assert hung_mount[HEALTHY.mountpoint] == app.disk_usage_pool._max_workers * 2